@@ -8,6 +8,7 @@ del _v
 # Main gt imports ----
 
 from .gt import GT
+from ._export import close_webdrivers, save_all
 from . import vals, loc, style
 from ._styles import FromColumn as from_column
 from ._helpers import (
@@ -39,6 +40,8 @@ __all__ = (
     "define_units",
     "nanoplot_options",
     "random_id",
+    "save_all",
+    "close_webdrivers",
     "from_column",
     "vals",
     "loc",
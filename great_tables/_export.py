@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import os
+import queue
 import tempfile
 import time
 import warnings
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from http.server import HTTPServer, SimpleHTTPRequestHandler
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Iterable, Literal
 
 from typing_extensions import TypeAlias
 
@@ -22,6 +25,7 @@ if TYPE_CHECKING:
     from selenium import webdriver
 
     from ._types import GTSelf
+    from ._utils_selenium import _BaseWebDriver
     from .gt import GT
 
 
@@ -226,12 +230,20 @@ def as_raw_html(
     ```
     """
 
-    built_table = self._build_data(context="html")
+    # Rendering is pure string building over the (immutable) table data, so reuse the
+    # result of a previous call with the same options where one exists
+    cache_key = (make_page, all_important)
+    table_html = self._html_cache.get(cache_key)
 
-    table_html = built_table._render_as_html(
-        make_page=make_page,
-        all_important=all_important,
-    )
+    if table_html is None:
+        built_table = self._build_data(context="html")
+
+        table_html = built_table._render_as_html(
+            make_page=make_page,
+            all_important=all_important,
+        )
+
+        self._html_cache[cache_key] = table_html
 
     if inline_css:
         _try_import(name="css_inline", pip_install_line="pip install css-inline")
@@ -359,6 +371,8 @@ WebDrivers: TypeAlias = Literal[
 
 DebugDumpOptions: TypeAlias = Literal["zoom", "width_resize", "final_resize"]
 
+ScreenshotEngines: TypeAlias = Literal["auto", "cdp", "element"]
+
 
 def save(
     self: GT,
@@ -370,6 +384,10 @@ def save(
     window_size: tuple[int, int] = (6000, 6000),
     debug_port: None | int = None,
     encoding: str = "utf-8",
+    engine: ScreenshotEngines = "auto",
+    quality: int = 85,
+    png_compress_level: int = 6,
+    png_optimize: bool = False,
     _debug_dump: DebugDumpOptions | None = None,
 ) -> GTSelf:
     """
@@ -381,7 +399,8 @@ def save(
     ----------
     file
         The name of the file to save the image to. Accepts names ending with .png, .bmp, and other
-        image extensions. Also accepts the extension .pdf.
+        image extensions. Also accepts the extension .pdf. With the `"cdp"` engine, .jpg/.jpeg and
+        .webp files are encoded natively by the browser.
     selector
         (NOT IMPLEMENTED) The HTML element name used to select table. Defaults to the whole table.
     scale
@@ -389,8 +408,10 @@ def save(
         resolution. A scale of 2 is equivalent to doubling the width of the table in pixels. Note
         that higher resolution results in larger file sizes.
     expand
-        (NOT IMPLEMENTED) The number of pixels to expand the screenshot by.  This can be
-        increased to capture more of the surrounding area, or decreased to capture less.
+        The number of pixels to expand the screenshot by.  This can be increased to capture more
+        of the surrounding area, or decreased to capture less. Currently only applied when the
+        table is captured directly through the browser's devtools protocol (PNG output on
+        Chromium-based drivers).
     web_driver
         The webdriver to use when taking the screenshot. Either a driver name, or webdriver
         instance. By default, uses Google Chrome. Supports `"firefox"` (Mozilla Firefox), `"safari"`
@@ -405,6 +426,22 @@ def save(
         Port number to use for debugging. By default no debugging port is opened.
     encoding
         The character encoding used for the HTML content.
+    engine
+        How the screenshot should be captured. `"cdp"` asks the browser for a natively
+        clipped capture of the table over the devtools protocol (Chromium-based drivers,
+        PNG output only); `"element"` screenshots the page body after resizing the window
+        to fit the table, which works on every driver. The default of `"auto"` uses
+        `"cdp"` where available and falls back to `"element"` otherwise.
+    quality
+        The encoding quality (`0`-`100`) used for lossy output formats (`.jpg`/`.jpeg` and
+        `.webp` with the `"cdp"` engine). Ignored for PNG and other lossless formats.
+    png_compress_level
+        The zlib compression level used for PNG output, from `0` (no compression) to `9`
+        (smallest). The default of `6` matches the browser's own encoder. A level of `1`
+        encodes several times faster and is a good choice for CI or batch pipelines.
+    png_optimize
+        If `True`, the PNG encoder makes an extra pass to minimize file size, which takes
+        longer. Useful for one-off exports where file size matters more than speed.
     _debug_dump
         Whether the saved image should be a big browser window, with key elements outlined. This is
         helpful for debugging this function's resizing, cropping heuristics. This is an internal
@@ -436,37 +473,53 @@ def save(
     ```
 
     """
-    # Import the required packages
-    _try_import(name="selenium", pip_install_line="pip install selenium")
-
-    from ._utils_selenium import _get_web_driver
-
+    # Validate inputs before any browser work, so a call that can't succeed fails in
+    # milliseconds rather than after a browser startup
     if selector != "table":
         raise NotImplementedError("Currently, only selector='table' is supported.")
 
+    _validate_save_args(scale=scale, expand=expand, window_size=window_size, quality=quality)
+
     # If there is no file extension, add the .png extension
     if Path(file).suffix == "":
         file = str(Path(file).with_suffix(".png"))
 
+    parent_dir = Path(file).parent
+    if not parent_dir.is_dir():
+        raise FileNotFoundError(f"The directory to save the file to does not exist: {parent_dir}")
+
+    # Import the required packages
+    _try_import(name="selenium", pip_install_line="pip install selenium")
+
+    from ._utils_selenium import _get_web_driver, _shared_web_driver
+
     # Get the HTML content from the displayed output
     html_content = as_raw_html(self)
 
-    wdriver = _get_web_driver(web_driver)
+    # For browsers specified by name, lease a shared webdriver that is kept alive between
+    # calls (starting a headless browser costs seconds, so reuse dominates batch saves).
+    # Webdriver instances passed in directly are used as-is.
+    if isinstance(web_driver, str):
+        wdriver_ctx = _shared_web_driver(web_driver, debug_port=debug_port)
+    else:
+        wdriver_ctx = _get_web_driver(web_driver)(debug_port=debug_port)
 
     # run browser ----
-    with (
-        tempfile.TemporaryDirectory() as tmp_dir,
-        wdriver(debug_port=debug_port) as headless_browser,
-    ):
-        # Write the HTML content to the temp file
-        with open(f"{tmp_dir}/table.html", "w", encoding=encoding) as temp_file:
-            temp_file.write(html_content)
-
-        # Open the HTML file in the headless browser
-        headless_browser.set_window_size(*window_size)
-        headless_browser.get("file://" + temp_file.name)
-
-        _save_screenshot(headless_browser, scale, file, debug=_debug_dump)
+    with wdriver_ctx as headless_browser:
+        _save_in_browser(
+            headless_browser,
+            html_content,
+            file,
+            scale=scale,
+            expand=expand,
+            window_size=window_size,
+            encoding=encoding,
+            debug=_debug_dump,
+            engine=engine,
+            quality=quality,
+            png_compress_level=png_compress_level,
+            png_optimize=png_optimize,
+        )
 
     if debug_port and web_driver not in {"chrome", "firefox"}:
         warnings.warn("debug_port argument only supported on chrome and firefox")
@@ -483,8 +536,426 @@ def save(
     return self
 
 
+def save_all(
+    tables_and_files: Iterable[tuple[GT, Path | str]],
+    scale: float = 1.0,
+    expand: int = 5,
+    web_driver: WebDrivers | webdriver.Remote = "chrome",
+    window_size: tuple[int, int] = (6000, 6000),
+    encoding: str = "utf-8",
+    concurrency: int = 1,
+    engine: ScreenshotEngines = "auto",
+    quality: int = 85,
+    png_compress_level: int = 6,
+    png_optimize: bool = False,
+) -> None:
+    """
+    Save many tables to image files using a single browser session.
+
+    Calling `GT.save()` in a loop pays the cost of starting a headless browser for every
+    table. `save_all()` renders each table in the same browser session, so a batch of N
+    tables costs one browser startup plus N renders.
+
+    Parameters
+    ----------
+    tables_and_files
+        An iterable of `(GT, file)` pairs, where each `file` is the path the table's
+        image should be written to (same extensions as `GT.save()`).
+    scale
+        The scaling factor that will be used when generating the images.
+    expand
+        The number of pixels to expand each screenshot by.
+    web_driver
+        The webdriver to use when taking the screenshots. Either a driver name, or
+        webdriver instance. By default, uses Google Chrome.
+    window_size
+        The size of the browser window to use when laying out the tables.
+    encoding
+        The character encoding used for the HTML content.
+    concurrency
+        The number of browsers to render with in parallel. The default of `1` uses a
+        single session. Higher values spawn a bounded pool of browsers and split the
+        batch across worker threads; each browser holds a full Chrome process in memory,
+        so this shouldn't simply be set to the core count. Ignored when a webdriver
+        instance is passed in, since a single instance can't be shared across threads.
+    engine
+        How the screenshots should be captured; see `GT.save()`.
+    quality
+        The encoding quality (`0`-`100`) used for lossy output formats; see `GT.save()`.
+    png_compress_level
+        The zlib compression level used for PNG output, from `0` (no compression) to `9`
+        (smallest). The default of `6` matches the browser's own encoder; `1` encodes
+        several times faster.
+    png_optimize
+        If `True`, the PNG encoder makes an extra pass to minimize file size.
+
+    Returns
+    -------
+    None
+        Image files are written to the specified paths and the function returns `None`.
+    """
+    _validate_save_args(scale=scale, expand=expand, window_size=window_size, quality=quality)
+
+    # Import the required packages
+    _try_import(name="selenium", pip_install_line="pip install selenium")
+
+    from ._utils_selenium import _get_web_driver, _shared_web_driver
+
+    # Render all tables up front, so a bad table or path fails before the browser does
+    # any work
+    pairs: list[tuple[str, Path | str]] = []
+    for gt, file in tables_and_files:
+        if Path(file).suffix == "":
+            file = str(Path(file).with_suffix(".png"))
+
+        parent_dir = Path(file).parent
+        if not parent_dir.is_dir():
+            raise FileNotFoundError(
+                f"The directory to save the file to does not exist: {parent_dir}"
+            )
+
+        pairs.append((as_raw_html(gt), file))
+
+    # A single webdriver instance can't be shared across threads, so render serially
+    if not isinstance(web_driver, str):
+        concurrency = 1
+
+    n_workers = max(1, min(concurrency, len(pairs), os.cpu_count() or 1))
+
+    if n_workers == 1:
+        if isinstance(web_driver, str):
+            wdriver_ctx = _shared_web_driver(web_driver)
+        else:
+            wdriver_ctx = _get_web_driver(web_driver)(debug_port=None)
+
+        with wdriver_ctx as headless_browser:
+            for html_content, file in pairs:
+                _save_in_browser(
+                    headless_browser,
+                    html_content,
+                    file,
+                    scale=scale,
+                    expand=expand,
+                    window_size=window_size,
+                    encoding=encoding,
+                    engine=engine,
+                    quality=quality,
+                    png_compress_level=png_compress_level,
+                    png_optimize=png_optimize,
+                )
+
+        return
+
+    # Parallel path: a bounded pool of dedicated browsers, leased per table. The work is
+    # dominated by browser time (Python releases the GIL while waiting on the driver), so
+    # threads get real parallelism here.
+    wrappers: list[_BaseWebDriver] = []
+    pool: queue.Queue[webdriver.Remote] = queue.Queue()
+
+    def _save_one(pair: tuple[str, Path | str]) -> None:
+        html_content, file = pair
+        browser = pool.get()
+        try:
+            _save_in_browser(
+                browser,
+                html_content,
+                file,
+                scale=scale,
+                expand=expand,
+                window_size=window_size,
+                encoding=encoding,
+                engine=engine,
+                quality=quality,
+                png_compress_level=png_compress_level,
+                png_optimize=png_optimize,
+            )
+        finally:
+            pool.put(browser)
+
+    # Build the pool inside the try, so that if a browser fails to start, the ones
+    # already started are still quit
+    try:
+        for _ in range(n_workers):
+            wrapper = _get_web_driver(web_driver)(debug_port=None)
+            wrappers.append(wrapper)
+            pool.put(wrapper.driver)
+
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            # list() forces evaluation, so worker exceptions propagate
+            list(executor.map(_save_one, pairs))
+    finally:
+        for wrapper in wrappers:
+            wrapper.driver.quit()
+
+
+def close_webdrivers() -> None:
+    """
+    Quit any webdrivers being kept alive for reuse across table saves.
+
+    `GT.save()` and `save_all()` keep a headless browser running between calls, so that
+    repeated saves don't each pay the cost of starting one. The browsers are closed
+    automatically when the Python process exits; call this to release them earlier.
+
+    Returns
+    -------
+    None
+        This function returns `None`.
+    """
+    try:
+        from ._utils_selenium import close_webdrivers as _close_webdrivers
+    except ImportError:
+        # Without selenium no webdriver was ever started, so there is nothing to close
+        return
+
+    _close_webdrivers()
+
+
+def _validate_save_args(
+    scale: float, expand: int, window_size: tuple[int, int], quality: int = 85
+) -> None:
+    """Check the scalar arguments shared by `save()` and `save_all()`."""
+
+    if scale <= 0:
+        raise ValueError(f"scale= must be a positive number (got {scale}).")
+
+    if expand < 0:
+        raise ValueError(f"expand= must be a non-negative number of pixels (got {expand}).")
+
+    if not (len(window_size) == 2 and all(isinstance(dim, int) for dim in window_size)):
+        raise ValueError("window_size= must be a tuple of two integers.")
+
+    if not 0 <= quality <= 100:
+        raise ValueError(f"quality= must be between 0 and 100 (got {quality}).")
+
+
+def _save_in_browser(
+    browser: webdriver.Remote,
+    html_content: str,
+    file: Path | str,
+    scale: float,
+    expand: int,
+    window_size: tuple[int, int],
+    encoding: str,
+    debug: DebugDumpOptions | None = None,
+    engine: ScreenshotEngines = "auto",
+    quality: int = 85,
+    png_compress_level: int = 6,
+    png_optimize: bool = False,
+) -> None:
+    """Render one table's HTML in an already-running browser and write its image."""
+
+    chosen_engine = _choose_engine(browser, file, engine, debug)
+
+    if chosen_engine == "cdp":
+        # Emulate the layout viewport rather than resizing the actual window, which
+        # avoids allocating a window-sized compositor surface just to lay out the table
+        browser.execute_cdp_cmd(
+            "Emulation.setDeviceMetricsOverride",
+            {
+                "width": window_size[0],
+                "height": window_size[1],
+                "deviceScaleFactor": 1,
+                "mobile": False,
+            },
+        )
+    else:
+        browser.set_window_size(*window_size)
+
+    _load_html(browser, html_content, encoding=encoding)
+
+    if chosen_engine == "cdp":
+        _save_screenshot_cdp(
+            browser,
+            scale,
+            str(file),
+            expand,
+            quality=quality,
+            png_compress_level=png_compress_level,
+            png_optimize=png_optimize,
+        )
+    else:
+        _save_screenshot(
+            browser,
+            scale,
+            str(file),
+            debug=debug,
+            png_compress_level=png_compress_level,
+            png_optimize=png_optimize,
+        )
+
+
+def _choose_engine(
+    browser: webdriver.Remote,
+    file: Path | str,
+    engine: ScreenshotEngines,
+    debug: DebugDumpOptions | None,
+) -> Literal["cdp", "element"]:
+    """Decide how to capture the table, validating an explicitly requested engine."""
+
+    # The debug dumps outline elements in a full browser window, which only makes sense
+    # for the element engine's resizing heuristics
+    if debug is not None:
+        return "element"
+
+    cdp_capable = hasattr(browser, "execute_cdp_cmd")
+
+    if engine == "cdp":
+        if not cdp_capable:
+            raise ValueError("engine='cdp' requires a Chromium-based webdriver.")
+        if Path(file).suffix not in _CDP_IMAGE_FORMATS:
+            formats = ", ".join(_CDP_IMAGE_FORMATS)
+            raise ValueError(f"engine='cdp' only supports these output formats: {formats}.")
+        return "cdp"
+
+    if engine == "element":
+        return "element"
+
+    if engine != "auto":
+        raise ValueError(f"Unsupported engine: {engine}")
+
+    if cdp_capable and Path(file).suffix in _CDP_IMAGE_FORMATS:
+        return "cdp"
+
+    return "element"
+
+
+def _load_html(driver: webdriver.Remote, html_content: str, encoding: str) -> None:
+    """Load HTML content into the browser, preferring an in-memory route.
+
+    Chromium-based drivers can set the document content directly over CDP, which skips
+    writing the HTML to disk and reading it back through a `file://` navigation. Other
+    drivers fall back to a temp file that is removed once the page has loaded.
+    """
+
+    if hasattr(driver, "execute_cdp_cmd"):
+        driver.get("about:blank")
+        frame_tree = driver.execute_cdp_cmd("Page.getFrameTree", {})
+        frame_id = frame_tree["frameTree"]["frame"]["id"]
+        driver.execute_cdp_cmd(
+            "Page.setDocumentContent", {"frameId": frame_id, "html": html_content}
+        )
+
+        # Unlike a file:// navigation, setDocumentContent returns before subresources
+        # (e.g. remote images from `fmt_image()`, web fonts) have loaded, so wait for
+        # them before screenshotting. Bounded, since a dead image URL never completes.
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline:
+            loaded = driver.execute_script(
+                "return document.fonts.status !== 'loading'"
+                " && Array.from(document.images).every((img) => img.complete);"
+            )
+            if loaded:
+                break
+            time.sleep(0.05)
+    else:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            f_path = Path(tmp_dir) / "table.html"
+            f_path.write_text(html_content, encoding=encoding)
+
+            # .get() returns once the page has loaded, so the temp dir can be cleaned up
+            driver.get("file://" + str(f_path))
+
+
+def _write_png(png_bytes: bytes, path: str, compress_level: int, optimize: bool) -> None:
+    """Write PNG bytes to disk, re-encoding only when non-default settings require it."""
+
+    if compress_level == 6 and not optimize:
+        Path(path).write_bytes(png_bytes)
+        return
+
+    _try_import(name="PIL", pip_install_line="pip install pillow")
+
+    from io import BytesIO
+
+    from PIL import Image
+
+    with Image.open(fp=BytesIO(png_bytes)) as image:
+        image.save(fp=path, format="png", compress_level=compress_level, optimize=optimize)
+
+
+# Output formats Chrome can encode natively in Page.captureScreenshot, by file suffix
+_CDP_IMAGE_FORMATS = {".png": "png", ".jpg": "jpeg", ".jpeg": "jpeg", ".webp": "webp"}
+
+
+def _save_screenshot_cdp(
+    driver: webdriver.Chrome,
+    scale: float,
+    path: str,
+    expand: int,
+    quality: int = 85,
+    png_compress_level: int = 6,
+    png_optimize: bool = False,
+) -> None:
+    """Capture only the table element via a clipped CDP screenshot.
+
+    Clipping to the table's bounding rect means Chrome rasterizes and transfers only the
+    pixels we keep, and the resulting PNG bytes can be written to disk as-is -- no window
+    resizing heuristics, and no decode/crop/re-encode pass through PIL. Scaling is done
+    through the emulated deviceScaleFactor, so higher scales render at true HiDPI rather
+    than enlarging a 1x raster.
+    """
+    import base64
+    import math
+
+    measure_table = (
+        "const r = document.getElementsByTagName('table')[0].getBoundingClientRect();"
+        " return [r.x, r.y, r.width, r.height];"
+    )
+
+    rect = driver.execute_script(measure_table)
+
+    # Shrink the emulated viewport to just the table, so only that area is composited
+    driver.execute_cdp_cmd(
+        "Emulation.setDeviceMetricsOverride",
+        {
+            "width": math.ceil(rect[2] + expand * 2),
+            "height": math.ceil(rect[3] + expand * 2),
+            "deviceScaleFactor": scale,
+            "mobile": False,
+        },
+    )
+
+    # Re-measure, since the narrowed viewport can shift the table (e.g. auto margins)
+    rect = driver.execute_script(measure_table)
+
+    image_format = _CDP_IMAGE_FORMATS[Path(path).suffix]
+
+    params = {
+        "format": image_format,
+        "clip": {
+            "x": max(rect[0] - expand, 0),
+            "y": max(rect[1] - expand, 0),
+            "width": rect[2] + expand * 2,
+            "height": rect[3] + expand * 2,
+            "scale": 1,
+        },
+        "captureBeyondViewport": True,
+        "fromSurface": True,
+    }
+
+    # quality only applies to the lossy encoders
+    if image_format in ("jpeg", "webp"):
+        params["quality"] = quality
+
+    result = driver.execute_cdp_cmd("Page.captureScreenshot", params)
+
+    driver.execute_cdp_cmd("Emulation.clearDeviceMetricsOverride", {})
+
+    data = base64.b64decode(result["data"])
+
+    if image_format == "png":
+        _write_png(data, path, png_compress_level, png_optimize)
+    else:
+        Path(path).write_bytes(data)
+
+
 def _save_screenshot(
-    driver: webdriver.Chrome, scale: float, path: str, debug: DebugDumpOptions | None
+    driver: webdriver.Chrome,
+    scale: float,
+    path: str,
+    debug: DebugDumpOptions | None,
+    png_compress_level: int = 6,
+    png_optimize: bool = False,
 ) -> None:
     from io import BytesIO
 
@@ -505,12 +976,21 @@ def _save_screenshot(
     # on CI with firefox sometimes the final screencapture is wider than necessary.
     original_size = driver.get_window_size()
 
-    # set table zoom ----
-    driver.execute_script(
+    # set table zoom and take the pre-resize measurements in a single round-trip; each
+    # execute_script call is a separate JSON-over-HTTP command to the driver, and doing
+    # the zoom and measurement in one script also guarantees they see the same layout ----
+    outer_width, outer_height, offset_left, offset_top, reported_width = driver.execute_script(
         "var el = document.getElementsByTagName('table')[0]; "
         f"el.style.zoom = '{scale}'; "
         "el.parentNode.style.display='none'; "
-        "el.parentNode.style.display='';"
+        "el.parentNode.style.display=''; "
+        "var w = window; "
+        "var div = document.body.childNodes[0]; "
+        "return ["
+        "  w.outerWidth - w.innerWidth, w.outerHeight - w.innerHeight,"
+        "  div.offsetLeft, div.offsetTop,"
+        "  el.clientWidth"
+        "];"
     )
 
     if debug == "zoom":
@@ -522,15 +1002,6 @@ def _save_screenshot(
     # onto new lines. this pads width and height for a little slack.
     # note that this is mostly to account for body, div padding, and table borders.
     crud_factor = 20
-    outer_width, outer_height = driver.execute_script(
-        "var w = window; return [w.outerWidth - w.innerWidth, w.outerHeight - w.innerHeight]"
-    )
-    offset_left, offset_top = driver.execute_script(
-        "var div = document.body.childNodes[0]; return [div.offsetLeft, div.offsetTop];"
-    )
-    reported_width = driver.execute_script(
-        "var el = document.getElementsByTagName('table')[0]; return el.clientWidth;"
-    )
     required_width = (reported_width + offset_left * 2) * scale + crud_factor + outer_width
 
     # set to our required_width first, in case it changes the height of the table
@@ -555,12 +1026,19 @@ def _save_screenshot(
 
     el = WebDriverWait(driver, 1).until(EC.visibility_of_element_located((By.TAG_NAME, "body")))
 
+    # the screenshot is already a PNG, so write it as-is rather than decoding and
+    # re-encoding it through PIL (unless non-default PNG settings were requested)
+    if Path(path).suffix == ".png":
+        _write_png(el.screenshot_as_png, path, png_compress_level, png_optimize)
+        return
+
     _try_import(name="PIL", pip_install_line="pip install pillow")
 
     from PIL import Image
 
     # convert to other formats (e.g. pdf, bmp) using PIL
-    Image.open(fp=BytesIO(el.screenshot_as_png)).save(fp=path)
+    with Image.open(fp=BytesIO(el.screenshot_as_png)) as image:
+        image.save(fp=path)
 
 
 def _dump_debug_screenshot(driver, path):
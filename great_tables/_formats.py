@@ -2952,6 +2952,21 @@ def _value_to_engineering_notation(value: int | float, n_sigfig: int, exp_style:
     return result
 
 
+def _insert_seps(integer_part: str, sep_mark: str) -> str:
+    """
+    Insert grouping separators into a string of digits (no sign, no decimal part).
+
+    CPython's built-in "," grouping does this in C, which is much faster than walking the
+    digits in a Python loop; the requested separator is swapped in afterwards.
+    """
+    grouped = f"{int(integer_part):,}"
+
+    if sep_mark != ",":
+        grouped = grouped.replace(",", sep_mark)
+
+    return grouped
+
+
 def _format_number_n_sigfig(
     value: int | float,
     n_sigfig: int,
@@ -2972,8 +2987,7 @@ def _format_number_n_sigfig(
     integer_part = number_parts[0].lstrip("-")
     decimal_part = number_parts[1] if len(number_parts) > 1 else ""
 
-    # Initialize formatted representations of integer and decimal parts
-    formatted_integer = ""
+    # Initialize the formatted representation of the decimal part
     formatted_decimal = dec_mark + decimal_part if decimal_part else ""
 
     if preserve_integer and "." not in formatted_value:
@@ -2981,12 +2995,7 @@ def _format_number_n_sigfig(
 
     # Insert grouping separators within the integer part
     if use_seps:
-        count = 0
-        for digit in reversed(integer_part):
-            if count and count % 3 == 0:
-                formatted_integer = sep_mark + formatted_integer
-            formatted_integer = digit + formatted_integer
-            count += 1
+        formatted_integer = _insert_seps(integer_part, sep_mark)
     else:
         formatted_integer = integer_part
 
@@ -3031,18 +3040,12 @@ def _format_number_fixed_decimals(
     integer_part = number_parts[0].lstrip("-")
     decimal_part = number_parts[1] if len(number_parts) > 1 else ""
 
-    # Initialize formatted representations of integer and decimal parts
-    formatted_integer = ""
+    # Initialize the formatted representation of the decimal part
     formatted_decimal = dec_mark + decimal_part if decimal_part else ""
 
     # Insert grouping separators within the integer part
     if use_seps:
-        count = 0
-        for digit in reversed(integer_part):
-            if count and count % 3 == 0:
-                formatted_integer = sep_mark + formatted_integer
-            formatted_integer = digit + formatted_integer
-            count += 1
+        formatted_integer = _insert_seps(integer_part, sep_mark)
     else:
         formatted_integer = integer_part
 
@@ -3122,6 +3125,11 @@ def _format_number_compactly(
 
 
 def _expand_exponential_to_full_string(str_number: str) -> str:
+    # Values without an exponent are already in full notation, so skip the Decimal
+    # construction for them
+    if "e" not in str_number and "E" not in str_number:
+        return str_number
+
     decimal_number = Decimal(str_number)
     formatted_number = "{:f}".format(decimal_number)
     return formatted_number
@@ -70,6 +70,10 @@ class GTData:
     _options: Options
     _has_built: bool = False
 
+    # Rendered HTML memoized per (make_page, all_important) combination. Mutators produce
+    # new objects through _replace(), which resets this, so entries can never go stale.
+    _html_cache: dict[tuple[bool, bool], str] = field(default_factory=dict, compare=False)
+
     def _replace(self, **kwargs: Any) -> Self:
         new_obj = copy.copy(self)
 
@@ -79,6 +83,10 @@ class GTData:
 
         new_obj.__dict__.update(kwargs)
 
+        # The copy no longer renders identically to the original (every mutator funnels
+        # through here), so start it with a fresh render cache
+        new_obj.__dict__["_html_cache"] = {}
+
         return new_obj
 
     @classmethod
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import atexit
+import threading
 from types import TracebackType
 from typing import Literal
 from typing_extensions import TypeAlias
@@ -19,7 +21,14 @@ class _BaseWebDriver:
         self.debug_port = debug_port
         self.wd_options = self.cls_wd_options()
         self.add_arguments()
-        self.driver = self.cls_driver(self.wd_options)
+
+        # Each save issues several HTTP commands to the driver; keep-alive reuses one TCP
+        # connection for all of them rather than paying a handshake per command. Recent
+        # selenium releases default to this, but older ones did not, so be explicit.
+        try:
+            self.driver = self.cls_driver(self.wd_options, keep_alive=True)
+        except TypeError:
+            self.driver = self.cls_driver(self.wd_options)
 
     def add_arguments(self): ...
 
@@ -41,6 +50,22 @@ class _ChromeWebDriver(_BaseWebDriver):
 
     def add_arguments(self):
         self.wd_options.add_argument("--headless=new")
+
+        # Trim startup work that a screenshot-only browser never needs
+        self.wd_options.add_argument("--disable-gpu")
+        self.wd_options.add_argument("--disable-dev-shm-usage")
+        self.wd_options.add_argument("--disable-extensions")
+        self.wd_options.add_argument("--disable-background-networking")
+        self.wd_options.add_argument("--disable-sync")
+        self.wd_options.add_argument("--disable-default-apps")
+        self.wd_options.add_argument("--no-first-run")
+        self.wd_options.add_argument("--mute-audio")
+        self.wd_options.add_argument("--hide-scrollbars")
+
+        # The pages we load are self-contained, so return from .get() as soon as the DOM
+        # is ready instead of waiting for the full load event
+        self.wd_options.page_load_strategy = "eager"
+
         if self.debug_port is not None:
             self.wd_options.add_argument(f"--remote-debugging-port={self.debug_port}")
 
@@ -68,6 +93,103 @@ class _EdgeWebDriver(_BaseWebDriver):
         self.wd_options.add_argument("--headless")
 
 
+# Webdrivers kept alive for reuse across `GT.save()` calls. Starting a headless browser
+# takes on the order of seconds, so a single long-lived driver amortizes that cost over
+# many saves. Keyed by (driver name, debug port); guarded by `_shared_lock`.
+_shared_drivers: dict[tuple[str, int | None], _BaseWebDriver] = {}
+_shared_lock = threading.Lock()
+
+
+class _SharedWebDriver:
+    """An exclusive lease on a cached webdriver, which is reset (rather than quit) on exit.
+
+    The lease's lock is acquired by `_shared_web_driver` and held until exit, so two
+    threads can never interleave commands on the same browser.
+    """
+
+    def __init__(self, wrapped: _BaseWebDriver):
+        self.wrapped = wrapped
+
+    def __enter__(self) -> webdriver.Remote:
+        return self.wrapped.driver
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> bool | None:
+        try:
+            # After an error the browser's state can't be trusted for reuse, so quit and
+            # discard it rather than handing it to the next save
+            if exc_value is not None:
+                _discard_shared_driver(self.wrapped)
+                return None
+
+            # Clear per-page state so the next save starts from a blank slate
+            driver = self.wrapped.driver
+            try:
+                driver.delete_all_cookies()
+                driver.get("about:blank")
+            except Exception:
+                _discard_shared_driver(self.wrapped)
+        finally:
+            self.wrapped.lease_lock.release()
+
+
+def _shared_web_driver(
+    web_driver: WebDrivers, debug_port: int | None = None
+) -> _SharedWebDriver | _BaseWebDriver:
+    """Return an exclusive lease on a lazily-created, module-cached webdriver.
+
+    If another thread currently holds the shared driver, a dedicated driver (quit on
+    exit, as before driver sharing existed) is handed out instead of blocking on it.
+    """
+    key = (web_driver, debug_port)
+
+    with _shared_lock:
+        wrapped = _shared_drivers.get(key)
+        if wrapped is None:
+            wrapped = _get_web_driver(web_driver)(debug_port=debug_port)
+            wrapped.lease_lock = threading.Lock()
+            _shared_drivers[key] = wrapped
+
+    if wrapped.lease_lock.acquire(blocking=False):
+        return _SharedWebDriver(wrapped)
+
+    return _get_web_driver(web_driver)(debug_port=debug_port)
+
+
+def _discard_shared_driver(wrapped: _BaseWebDriver) -> None:
+    """Quit a cached webdriver and drop it from the cache, tolerating a dead browser."""
+    with _shared_lock:
+        for key, value in list(_shared_drivers.items()):
+            if value is wrapped:
+                del _shared_drivers[key]
+
+    try:
+        wrapped.driver.quit()
+    except Exception:
+        pass
+
+
+def close_webdrivers() -> None:
+    """Quit any webdrivers being kept alive for reuse across `GT.save()` calls."""
+    with _shared_lock:
+        drivers = list(_shared_drivers.values())
+        _shared_drivers.clear()
+
+    for wrapped in drivers:
+        try:
+            wrapped.driver.quit()
+        except Exception:
+            # A driver whose browser already exited should not block cleanup of the rest
+            pass
+
+
+atexit.register(close_webdrivers)
+
+
 def no_op_callable(web_driver: webdriver.Remote):
     def wrapper(*args, **kwargs):
         return web_driver
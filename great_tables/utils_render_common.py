@@ -35,8 +35,14 @@ def get_row_reorder_df(stub_df: Stub, groups: RowGroups | None = None) -> list[T
 
     # where in the group each element is
     # TODO: this doesn't yield consistent values
+    # build a position lookup once, rather than scanning `groups` per row (O(N*G));
+    # like list.index, the first occurrence of a group id wins
+    group_pos = {}
+    for ii, group_id in enumerate(groups):
+        group_pos.setdefault(group_id, ii)
+
     groups_pos = [
-        groups.index(row.group_id) if row.group_id is not None else -1 for row in stub_df.rows
+        group_pos[row.group_id] if row.group_id is not None else -1 for row in stub_df.rows
     ]
 
     # From running test_body_reassemble():
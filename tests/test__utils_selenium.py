@@ -1,12 +1,17 @@
+import threading
+
 import pytest
 
 from great_tables._utils_selenium import (
     _get_web_driver,
     no_op_callable,
+    close_webdrivers,
     _ChromeWebDriver,
     _SafariWebDriver,
     _FirefoxWebDriver,
     _EdgeWebDriver,
+    _SharedWebDriver,
+    _shared_drivers,
 )
 
 
@@ -37,3 +42,93 @@ def test_get_web_driver_raise():
     with pytest.raises(ValueError) as exc_info:
         _get_web_driver(fake_web_driver)
         assert exc_info.value.args[0] == f"Unsupported web driver: {fake_web_driver}"
+
+
+class _FakeDriver:
+    def __init__(self):
+        self.quit_called = False
+        self.cookies_deleted = False
+        self.urls = []
+
+    def quit(self):
+        self.quit_called = True
+
+    def delete_all_cookies(self):
+        self.cookies_deleted = True
+
+    def get(self, url):
+        self.urls.append(url)
+
+
+class _FakeWrapped:
+    def __init__(self):
+        self.driver = _FakeDriver()
+
+        # mirror a driver whose lease has been acquired by _shared_web_driver
+        self.lease_lock = threading.Lock()
+        self.lease_lock.acquire()
+
+
+def test_shared_web_driver_resets_on_exit():
+    wrapped = _FakeWrapped()
+    with _SharedWebDriver(wrapped) as driver:
+        assert driver is wrapped.driver
+
+    # The lease resets the driver instead of quitting, so it can be reused
+    assert not wrapped.driver.quit_called
+    assert wrapped.driver.cookies_deleted
+    assert wrapped.driver.urls == ["about:blank"]
+
+
+def test_close_webdrivers_quits_cached_drivers():
+    wrapped = _FakeWrapped()
+    _shared_drivers[("fake", None)] = wrapped
+
+    close_webdrivers()
+
+    assert wrapped.driver.quit_called
+    assert not _shared_drivers
+
+
+def test_shared_web_driver_discarded_on_error():
+    wrapped = _FakeWrapped()
+    _shared_drivers[("fake", None)] = wrapped
+
+    with pytest.raises(RuntimeError):
+        with _SharedWebDriver(wrapped):
+            raise RuntimeError("boom")
+
+    # A failed save quits the driver and removes it from the cache, rather than
+    # handing a browser in an unknown state to the next save
+    assert wrapped.driver.quit_called
+    assert ("fake", None) not in _shared_drivers
+
+
+def test_shared_web_driver_lease_is_exclusive(monkeypatch):
+    from great_tables import _utils_selenium as mod
+
+    class _FakeWebDriver:
+        def __init__(self, debug_port=None):
+            self.driver = _FakeDriver()
+
+        def __enter__(self):
+            return self.driver
+
+        def __exit__(self, *args):
+            self.driver.quit()
+
+    monkeypatch.setattr(mod, "_get_web_driver", lambda web_driver: _FakeWebDriver)
+    monkeypatch.setattr(mod, "_shared_drivers", {})
+
+    with mod._shared_web_driver("fake") as d1:
+        # while the shared driver is leased, a concurrent call gets a dedicated driver
+        # rather than the same browser
+        with mod._shared_web_driver("fake") as d2:
+            assert d2 is not d1
+
+        # the dedicated driver is quit on exit, like before driver sharing existed
+        assert d2.quit_called
+
+    # once the lease is released, the shared driver is handed out again
+    with mod._shared_web_driver("fake") as d3:
+        assert d3 is d1
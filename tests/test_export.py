@@ -180,3 +180,80 @@ def test_pickle():
 
     # verify that column label is preserved
     assert _get_column_labels(gt=gt_tbl2, context="html")[0] == "new_col"
+
+
+def test_as_raw_html_cached(gt_tbl_small: GT):
+    first = gt_tbl_small.as_raw_html()
+
+    # an unchanged table reuses the rendered HTML outright
+    assert gt_tbl_small.as_raw_html() is first
+
+    # any mutation produces a new object with a fresh cache
+    modified = gt_tbl_small.tab_header(title="A new title")
+    assert "A new title" in modified.as_raw_html()
+    assert "A new title" not in gt_tbl_small.as_raw_html()
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        dict(scale=0),
+        dict(scale=-1.0),
+        dict(expand=-5),
+        dict(window_size=(100,)),
+        dict(window_size=(100.5, 100.5)),
+    ],
+)
+def test_save_invalid_args_raise(gt_tbl: GT, tmp_path, kwargs):
+    with pytest.raises(ValueError):
+        gt_tbl.save(file=str(tmp_path / "table.png"), **kwargs)
+
+
+def test_save_missing_directory_raises(gt_tbl: GT, tmp_path):
+    with pytest.raises(FileNotFoundError):
+        gt_tbl.save(file=str(tmp_path / "no_such_dir" / "table.png"))
+
+
+class _FakeCdpBrowser:
+    def execute_cdp_cmd(self, cmd, args):  # pragma: no cover
+        pass
+
+
+@pytest.mark.parametrize(
+    "browser, file, engine, dst",
+    [
+        (_FakeCdpBrowser(), "t.png", "auto", "cdp"),
+        (_FakeCdpBrowser(), "t.pdf", "auto", "element"),
+        (_FakeCdpBrowser(), "t.png", "element", "element"),
+        (object(), "t.png", "auto", "element"),
+    ],
+)
+def test_choose_engine(browser, file, engine, dst):
+    from great_tables._export import _choose_engine
+
+    assert _choose_engine(browser, file, engine, debug=None) == dst
+
+
+def test_choose_engine_raises():
+    from great_tables._export import _choose_engine
+
+    # cdp requested on a driver that can't do it
+    with pytest.raises(ValueError):
+        _choose_engine(object(), "t.png", "cdp", debug=None)
+
+    # cdp requested for an output format it doesn't support
+    with pytest.raises(ValueError):
+        _choose_engine(_FakeCdpBrowser(), "t.pdf", "cdp", debug=None)
+
+
+@pytest.mark.parametrize("file", ["t.jpg", "t.jpeg", "t.webp"])
+def test_choose_engine_lossy_formats(file):
+    from great_tables._export import _choose_engine
+
+    # lossy formats are encoded natively by the browser on cdp-capable drivers
+    assert _choose_engine(_FakeCdpBrowser(), file, "auto", debug=None) == "cdp"
+
+
+def test_save_invalid_quality_raises(gt_tbl: GT, tmp_path):
+    with pytest.raises(ValueError):
+        gt_tbl.save(file=str(tmp_path / "table.jpg"), quality=101)